@@ -5,6 +5,7 @@ import logging
 import re
 import shutil
 from pathlib import Path
+from typing import ClassVar
 
 import yaml
 from tqdm import tqdm
@@ -27,18 +28,11 @@ class DocumentationBuilder:
         copy_extensions: Set of file extensions that are supported for copying.
     """
 
-    def __init__(self, src_dir: Path, build_dir: Path) -> None:
-        """Initialize the DocumentationBuilder.
-
-        Args:
-            src_dir: Path to the source directory containing documentation files.
-            build_dir: Path to the build directory where files will be copied.
-        """
-        self.src_dir = src_dir
-        self.build_dir = build_dir
-
-        # File extensions to copy directly
-        self.copy_extensions: set[str] = {
+    # File extensions to copy directly. Class-level frozenset: the set is
+    # immutable and shared, so builders don't rebuild it per instance and
+    # membership checks hit one cached object.
+    copy_extensions: frozenset[str] = frozenset(
+        {
             ".mdx",
             ".md",
             ".json",
@@ -52,12 +46,23 @@ class DocumentationBuilder:
             ".css",
             ".js",
         }
+    )
 
-        # Mapping of language codes to full names for URLs
-        self.language_url_names = {
-            "python": "python",
-            "js": "javascript",
-        }
+    # Mapping of language codes to full names for URLs
+    language_url_names: ClassVar[dict[str, str]] = {
+        "python": "python",
+        "js": "javascript",
+    }
+
+    def __init__(self, src_dir: Path, build_dir: Path) -> None:
+        """Initialize the DocumentationBuilder.
+
+        Args:
+            src_dir: Path to the source directory containing documentation files.
+            build_dir: Path to the build directory where files will be copied.
+        """
+        self.src_dir = src_dir
+        self.build_dir = build_dir
 
     def build_all(self) -> None:
         """Build all documentation files from source to build directory.
@@ -6,12 +6,13 @@ build pipeline, enabling automatic rebuilds when source files change.
 
 import asyncio
 import contextlib
+import functools
 import logging
 import os
 import sys
 import time
 from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
+from pathlib import Path, PurePath
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
@@ -20,6 +21,32 @@ from pipeline.core.builder import DocumentationBuilder
 
 logger = logging.getLogger(__name__)
 
+# Suffix groups for files the watcher ignores. Module-level constants so the
+# per-event check is two C-level endswith calls against shared tuples.
+_BACKUP_SUFFIXES = ("~", ".bak", ".orig")
+_HIDDEN_TEMP_SUFFIXES = (".tmp", ".temp", ".swp")
+
+
+@functools.lru_cache(maxsize=4096)
+def _should_ignore_name(file_name: str) -> bool:
+    """Return whether a file name matches an ignored suffix pattern.
+
+    Editors fire repeated events for the same handful of files, so the
+    verdict per name is cached; repeat events cost one dict lookup.
+
+    Args:
+        file_name: Final path component of the file to check.
+
+    Returns:
+        True if the file should be ignored, False otherwise.
+    """
+    # Ignore backup files created by editors
+    if file_name.endswith(_BACKUP_SUFFIXES):
+        return True
+
+    # Ignore other kinds of temporary files
+    return file_name.startswith(".") and file_name.endswith(_HIDDEN_TEMP_SUFFIXES)
+
 
 class DocsFileHandler(FileSystemEventHandler):
     """Handles file system events for documentation files.
@@ -52,7 +79,7 @@ class DocsFileHandler(FileSystemEventHandler):
         self.event_queue = event_queue
         self.loop = loop
 
-    def _should_ignore_file(self, file_path: Path) -> bool:
+    def _should_ignore_file(self, file_path: PurePath) -> bool:
         """Check if a file should be ignored by the watcher.
 
         Ignores temporary files, backup files, and other non-source files.
@@ -63,16 +90,7 @@ class DocsFileHandler(FileSystemEventHandler):
         Returns:
             True if the file should be ignored, False otherwise.
         """
-        file_name = file_path.name
-
-        # Ignore backup files created by editors
-        if file_name.endswith(("~", ".bak", ".orig")):
-            return True
-
-        # Ignore other kinds of temporary files
-        return bool(
-            file_name.startswith(".") and file_name.endswith((".tmp", ".temp", ".swp"))
-        )
+        return _should_ignore_name(file_path.name)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
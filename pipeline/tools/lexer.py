@@ -43,31 +43,98 @@ class Token:
 
 
 # ---------------------------------------------------------------------------
-# Regular-expressions are evaluated against the *trimmed* line (indent removed)
+# Line classification
 # ---------------------------------------------------------------------------
 
-_PATTERNS: list[tuple[TokenType, re.Pattern[str]]] = [
-    # Block/ATX headings
-    (TokenType.HEADING, re.compile(r"(#{1,6})\s+.*")),
-    # Fenced code blocks
-    (TokenType.FENCE, re.compile(r"```(?:\S*)")),
-    # Unordered and ordered list markers
-    (TokenType.UL_MARKER, re.compile(r"[-+*]\s+")),
-    (TokenType.OL_MARKER, re.compile(r"\d+[.)]\s+")),
-    # Blockquote prefix
-    (TokenType.BLOCKQUOTE, re.compile(r">")),
-    # === "Tab" blocks
-    (TokenType.TAB_HEADER, re.compile(r'===\s*"[^"]+"')),
-    # Front matter (YAML)
-    (TokenType.FRONT_MATTER, re.compile(r"^-{3,}\s*$")),
-    # !!! or ??? admonitions
-    (TokenType.ADMONITION, re.compile(r"(?:!!!|\?\?\?)\s+\w+(?:\s+\"[^\"]+\")?")),
-    # Conditional block opening tags: :::python, :::js (language required)
-    (TokenType.CONDITIONAL_BLOCK_OPEN, re.compile(r":::(python|js)\s*$")),
-    # Conditional block closing tag: :::
-    (TokenType.CONDITIONAL_BLOCK_CLOSE, re.compile(r":::\s*$")),
-    (TokenType.HTML_TAG, re.compile(r"<[/A-Za-z][^>]*>.*$")),
-]
+# The only patterns whose tails are too irregular for a hand-written scan;
+# both are evaluated against the *trimmed* line (indent removed) and only
+# after the cheap first-character dispatch below has selected them.
+
+# !!! or ??? admonitions
+_ADMONITION_RE = re.compile(r"(?:!!!|\?\?\?)\s+\w+(?:\s+\"[^\"]+\")?")
+# <div> ... (single-line HTML tag)
+_HTML_TAG_RE = re.compile(r"<[/A-Za-z][^>]*>.*$")
+
+
+def _classify_line(trimmed: str) -> TokenType:  # noqa: PLR0911
+    """Classify a non-blank trimmed line into its token type.
+
+    Dispatches on the first character, so a typical text line is rejected
+    with a single comparison instead of a walk through a regex table. Each
+    branch mirrors one of the original line patterns exactly; the two
+    shapes that still warrant a regex (admonitions and HTML tags) only run
+    it when their lead characters match.
+    """
+    ch = trimmed[0]
+    if ch == "#":
+        # #{1,6} followed by whitespace
+        hashes = len(trimmed) - len(trimmed.lstrip("#"))
+        max_heading_level = 6
+        if hashes <= max_heading_level and trimmed[hashes : hashes + 1].isspace():
+            return TokenType.HEADING
+        return TokenType.TEXT
+    if ch == "`":
+        # ``` opens/closes a fence, optionally followed by lang/meta
+        if trimmed.startswith("```"):
+            return TokenType.FENCE
+        return TokenType.TEXT
+    if ch in "-+*":
+        # list marker: [-+*] followed by whitespace
+        if trimmed[1:2].isspace():
+            return TokenType.UL_MARKER
+        if ch == "-":
+            # front matter: three or more dashes, then only whitespace
+            stripped = trimmed.rstrip()
+            min_dashes = 3
+            if len(stripped) >= min_dashes and not stripped.strip("-"):
+                return TokenType.FRONT_MATTER
+        return TokenType.TEXT
+    if ch.isdecimal():
+        # ordered list marker: decimal digits (\d), '.' or ')', then
+        # whitespace; isdecimal matches \d exactly, unlike isdigit which
+        # also accepts superscripts and circled numbers
+        i = 1
+        length = len(trimmed)
+        while i < length and trimmed[i].isdecimal():
+            i += 1
+        if i < length - 1 and trimmed[i] in ".)" and trimmed[i + 1].isspace():
+            return TokenType.OL_MARKER
+        return TokenType.TEXT
+    if ch == ">":
+        return TokenType.BLOCKQUOTE
+    if ch == "=":
+        # === "title"  ->  skip optional whitespace, then a non-empty
+        # double-quoted title
+        if trimmed.startswith("==="):
+            i = 3
+            length = len(trimmed)
+            while i < length and trimmed[i].isspace():
+                i += 1
+            if (
+                i + 1 < length
+                and trimmed[i] == '"'
+                and trimmed[i + 1] != '"'
+                and trimmed.find('"', i + 2) != -1
+            ):
+                return TokenType.TAB_HEADER
+        return TokenType.TEXT
+    if ch in "!?":
+        if _ADMONITION_RE.match(trimmed):
+            return TokenType.ADMONITION
+        return TokenType.TEXT
+    if ch == ":":
+        # :::python / :::js open a conditional block, bare ::: closes one;
+        # anything else after the fence is plain text
+        if trimmed.startswith(":::"):
+            tail = trimmed[3:].rstrip()
+            if tail in ("python", "js"):
+                return TokenType.CONDITIONAL_BLOCK_OPEN
+            if not tail:
+                return TokenType.CONDITIONAL_BLOCK_CLOSE
+        return TokenType.TEXT
+    if ch == "<" and _HTML_TAG_RE.match(trimmed):
+        return TokenType.HTML_TAG
+    return TokenType.TEXT
 
 
 # ---------------------------------------------------------------------------
@@ -77,6 +144,12 @@ _PATTERNS: list[tuple[TokenType, re.Pattern[str]]] = [
 
 def _indent_width(line: str) -> int:
     """Return indent width in spaces, expanding tabs with `TAB_SIZE`."""
+    # Fast path: pure-space indents (the overwhelmingly common case) are
+    # measured with one C-level lstrip instead of a per-character loop.
+    rest = line.lstrip(" ")
+    if not rest.startswith("\t"):
+        return len(line) - len(rest)
+
     width = 0
     for ch in line:
         if ch == " ":
@@ -103,8 +176,11 @@ def lex(text: str | Iterable[str]) -> Iterator[Token]:
     Yields:
         Token objects, **including** a final EOF token.
     """
-    lines = text.splitlines() if isinstance(text, str) else list(text)
+    # splitlines() materializes a list anyway; other iterables are consumed
+    # lazily instead of being copied just to learn their length.
+    lines = text.splitlines() if isinstance(text, str) else text
 
+    idx = 0
     for idx, raw in enumerate(lines, 1):
         indent = _indent_width(raw)
         trimmed = raw[indent:]
@@ -114,17 +190,10 @@ def lex(text: str | Iterable[str]) -> Iterator[Token]:
             yield Token(TokenType.BLANK, "", indent, idx)
             continue
 
-        # match token patterns, first hit wins
-        for ttype, pattern in _PATTERNS:
-            if pattern.match(trimmed):
-                yield Token(ttype, trimmed, indent, idx)
-                break
-        else:
-            # fallback: plain text
-            yield Token(TokenType.TEXT, trimmed, indent, idx)
+        yield Token(_classify_line(trimmed), trimmed, indent, idx)
 
     # synthetic EOF token (needed for parsers that expect a sentinel)
-    yield Token(TokenType.EOF, "", 0, len(lines) + 1)
+    yield Token(TokenType.EOF, "", 0, idx + 1)
 
 
 __all__ = ["Token", "TokenType", "lex"]
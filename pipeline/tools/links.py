@@ -8,12 +8,17 @@ the old file location to point to the new location, ensuring no links break.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import json
 import logging
 import os
 import re
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 import nbformat
 
@@ -22,15 +27,34 @@ ENCODING: str = "utf-8"
 # Pattern to match Markdown links in the form of `[label](url)`
 # or `[label](url#anchor)`.
 _LINK_PATTERN: re.Pattern[str] = re.compile(r"(\[[^\]]+\])\(([^)\s#]+)(#[^)\s]*)?\)")
-_LinkChange = tuple[str, str]  # (old_url, new_url)
+
+
+class _LinkChange(NamedTuple):
+    """A single link rewrite; compares equal to a plain `(old, new)` tuple."""
+
+    old_url: str
+    new_url: str
 
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
+def _find_git_root_resolved(start: Path) -> Path:
+    """Walk up from an already-resolved *start* until `.git` is found."""
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").is_dir():
+            return candidate
+    msg = f"Could not locate Git repository root from {start}."
+    raise RuntimeError(msg)
+
+
 def _find_git_root(start: Path) -> Path:
     """Return the repository root - the closest ancestor containing `.git`.
 
+    Bulk moves call this once per file with the same starting directory, so
+    the upward walk is cached on the resolved path.
+
     Args:
         start: A path *inside* the repository.
 
@@ -41,11 +65,7 @@ def _find_git_root(start: Path) -> Path:
         RuntimeError: If no `.git` directory is found while traversing up the
             directory tree.
     """
-    for candidate in (start, *start.parents):
-        if (candidate / ".git").is_dir():
-            return candidate
-    msg = f"Could not locate Git repository root from {start}."
-    raise RuntimeError(msg)
+    return _find_git_root_resolved(start.resolve())
 
 
 def _rel_to_docs_root(path: Path, docs_root: Path) -> Path:
@@ -61,6 +81,32 @@ def _rel_to_docs_root(path: Path, docs_root: Path) -> Path:
     return path.resolve().relative_to(docs_root.resolve())
 
 
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write *text* to *path* via a sibling temp file and atomic rename.
+
+    The content is encoded once and published with a single
+    :func:`os.replace`, so a crash mid-write can never leave a
+    half-rewritten documentation file behind.
+
+    Args:
+        path: Destination file.
+        text: Full new file content.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_path = Path(tmp_name)
+    try:
+        # mkstemp creates the temp file 0600; carry the destination's mode
+        # over so the rename doesn't restrict the rewritten doc's permissions.
+        os.fchmod(fd, path.stat().st_mode)
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(text.encode(ENCODING))
+        tmp_path.replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink()
+        raise
+
+
 def _update_internal_links_in_moved_file(
     file_path: Path,
     old_parent: Path,
@@ -88,6 +134,31 @@ def _update_internal_links_in_moved_file(
     modified: bool = False
     changes: list[_LinkChange] = []
 
+    # The same URL often appears several times in one file; resolving it
+    # (resolve + exists + relpath) is pure function-of-input work, so the
+    # verdict is memoized per file. None means "leave unchanged".
+    docs_root_resolved = docs_root.resolve()
+    resolved_urls: dict[str, str | None] = {}
+
+    def _resolve_url(url: str, anchor: str, full_url: str) -> str | None:
+        try:
+            # Calculate what the link was pointing to from the old location
+            old_target = (old_parent / url).resolve()
+
+            # Check if the target exists and is within docs_root
+            if old_target.exists() and old_target.is_relative_to(docs_root_resolved):
+                # Calculate new relative path from new location
+                new_rel = os.path.relpath(old_target, new_parent)
+                new_full_url = Path(new_rel).as_posix() + anchor
+
+                # Only update if the path actually changed
+                if new_full_url != full_url:
+                    return new_full_url
+        except (ValueError, OSError):
+            # Path resolution failed or target outside docs_root - leave unchanged
+            pass
+        return None
+
     def _replacer(match: re.Match[str]) -> str:
         nonlocal modified
         label, url, anchor = match.groups()
@@ -103,38 +174,29 @@ def _update_internal_links_in_moved_file(
             return match.group(0)
 
         # This is a relative link - we need to update it
-        try:
-            # Calculate what the link was pointing to from the old location
-            old_target = (old_parent / url).resolve()
+        if full_url in resolved_urls:
+            new_full_url = resolved_urls[full_url]
+        else:
+            new_full_url = _resolve_url(url, anchor, full_url)
+            resolved_urls[full_url] = new_full_url
 
-            # Check if the target exists and is within docs_root
-            if old_target.exists() and old_target.is_relative_to(docs_root.resolve()):
-                # Calculate new relative path from new location
-                new_rel = os.path.relpath(old_target, new_parent)
-                new_rel_posix = Path(new_rel).as_posix()
-                new_full_url = new_rel_posix + anchor
+        if new_full_url is None:
+            return match.group(0)
 
-                # Only update if the path actually changed
-                if new_full_url != full_url:
-                    changes.append((full_url, new_full_url))
-
-                    if dry_run:
-                        logger.info(
-                            "Would update internal link in moved file %s: %s -> %s",
-                            file_path.relative_to(docs_root),
-                            full_url,
-                            new_full_url,
-                        )
-                    modified = True
-                    return f"{label}({new_full_url})"
-        except (ValueError, OSError):
-            # Path resolution failed or target outside docs_root - leave unchanged
-            pass
-        return match.group(0)
+        changes.append(_LinkChange(full_url, new_full_url))
+        if dry_run:
+            logger.info(
+                "Would update internal link in moved file %s: %s -> %s",
+                file_path.relative_to(docs_root),
+                full_url,
+                new_full_url,
+            )
+        modified = True
+        return f"{label}({new_full_url})"
 
     new_src: str = _LINK_PATTERN.sub(_replacer, src)
     if modified and not dry_run:
-        file_path.write_text(new_src, encoding=ENCODING)
+        _write_text_atomic(file_path, new_src)
 
     return changes
 
@@ -159,9 +221,28 @@ def _rewrite_links(
     Returns:
         A list of `(old_url, new_url)` tuples representing link changes.
     """
-    src: str = md_file.read_text(encoding=ENCODING)
+    # Any relative URL that resolves to the moved file must spell out its
+    # stem, so a raw-bytes substring probe skips the decode and regex scan
+    # for the (typical) files that never mention the target.
+    raw: bytes = md_file.read_bytes()
+    if old_abs.stem.encode(ENCODING) not in raw:
+        return []
+
+    src: str = raw.decode(ENCODING)
     modified: bool = False
     changes: list[_LinkChange] = []
+    # Bound method cached as a local so the callback skips the attribute
+    # lookup on every match.
+    _append = changes.append
+
+    # The moved file's docs-root-relative path is the same for every match,
+    # so resolve it once here instead of per link.
+    docs_root_resolved = docs_root.resolve()
+    try:
+        old_rel = old_abs.resolve().relative_to(docs_root_resolved)
+    except ValueError:
+        # Moved file is outside docs_root - nothing in here can point to it.
+        return []
 
     def _replacer(match: re.Match[str]) -> str:
         nonlocal modified
@@ -177,14 +258,12 @@ def _rewrite_links(
 
         resolved = (md_file.parent / url).resolve()
         try:
-            if _rel_to_docs_root(resolved, docs_root) == _rel_to_docs_root(
-                old_abs, docs_root
-            ):
+            if resolved.relative_to(docs_root_resolved) == old_rel:
                 new_rel = os.path.relpath(new_abs, md_file.parent)
                 new_rel_posix = Path(new_rel).as_posix()
                 new_full_url = new_rel_posix + anchor
 
-                changes.append((full_url, new_full_url))
+                _append(_LinkChange(full_url, new_full_url))
 
                 if dry_run:
                     logger.info(
@@ -202,7 +281,7 @@ def _rewrite_links(
 
     new_src: str = _LINK_PATTERN.sub(_replacer, src)
     if modified and not dry_run:
-        md_file.write_text(new_src, encoding=ENCODING)
+        _write_text_atomic(md_file, new_src)
 
     return changes
 
@@ -234,6 +313,30 @@ def _update_internal_links_in_moved_notebook(
     changes: list[_LinkChange] = []
     modified = False
 
+    # As in _update_internal_links_in_moved_file, memoize per-URL verdicts;
+    # the dict is shared across all markdown cells of the notebook.
+    docs_root_resolved = docs_root.resolve()
+    resolved_urls: dict[str, str | None] = {}
+
+    def _resolve_url(url: str, anchor: str, full_url: str) -> str | None:
+        try:
+            # Calculate what the link was pointing to from the old location
+            old_target = (old_parent / url).resolve()
+
+            # Check if the target exists and is within docs_root
+            if old_target.exists() and old_target.is_relative_to(docs_root_resolved):
+                # Calculate new relative path from new location
+                new_rel = os.path.relpath(old_target, new_parent)
+                new_full_url = Path(new_rel).as_posix() + anchor
+
+                # Only update if the path actually changed
+                if new_full_url != full_url:
+                    return new_full_url
+        except (ValueError, OSError):
+            # Path resolution failed or target outside docs_root - leave unchanged
+            pass
+        return None
+
     def _replacer(match: re.Match[str]) -> str:
         nonlocal modified
         label, url, anchor = match.groups()
@@ -249,34 +352,25 @@ def _update_internal_links_in_moved_notebook(
             return match.group(0)
 
         # This is a relative link - we need to update it
-        try:
-            # Calculate what the link was pointing to from the old location
-            old_target = (old_parent / url).resolve()
+        if full_url in resolved_urls:
+            new_full_url = resolved_urls[full_url]
+        else:
+            new_full_url = _resolve_url(url, anchor, full_url)
+            resolved_urls[full_url] = new_full_url
 
-            # Check if the target exists and is within docs_root
-            if old_target.exists() and old_target.is_relative_to(docs_root.resolve()):
-                # Calculate new relative path from new location
-                new_rel = os.path.relpath(old_target, new_parent)
-                new_rel_posix = Path(new_rel).as_posix()
-                new_full_url = new_rel_posix + anchor
+        if new_full_url is None:
+            return match.group(0)
 
-                # Only update if the path actually changed
-                if new_full_url != full_url:
-                    changes.append((full_url, new_full_url))
-
-                    if dry_run:
-                        logger.info(
-                            "Would update internal link in moved notebook %s: %s -> %s",
-                            file_path.relative_to(docs_root),
-                            full_url,
-                            new_full_url,
-                        )
-                    modified = True
-                    return f"{label}({new_full_url})"
-        except (ValueError, OSError):
-            # Path resolution failed or target outside docs_root - leave unchanged
-            pass
-        return match.group(0)
+        changes.append(_LinkChange(full_url, new_full_url))
+        if dry_run:
+            logger.info(
+                "Would update internal link in moved notebook %s: %s -> %s",
+                file_path.relative_to(docs_root),
+                full_url,
+                new_full_url,
+            )
+        modified = True
+        return f"{label}({new_full_url})"
 
     # Process all cells in the notebook
     for cell in notebook.cells:
@@ -315,11 +409,25 @@ def _rewrite_links_in_notebook(
         docs_root: The root of the documentation tree.
         dry_run: Whether the operation is a preview (no disk writes).
     """
+    # Same raw-bytes probe as _rewrite_links: skip the JSON parse entirely
+    # for notebooks that never mention the moved file's stem.
+    if old_abs.stem.encode(ENCODING) not in notebook_file.read_bytes():
+        return []
+
     notebook = nbformat.read(notebook_file, as_version=nbformat.NO_CONVERT)
     changes: list[_LinkChange] = []
+    _append = changes.append
 
     modified = False
 
+    # As in _rewrite_links, resolve the moved file's relative path once.
+    docs_root_resolved = docs_root.resolve()
+    try:
+        old_rel = old_abs.resolve().relative_to(docs_root_resolved)
+    except ValueError:
+        # Moved file is outside docs_root - nothing in here can point to it.
+        return []
+
     def _replacer(match: re.Match[str]) -> str:
         nonlocal modified
         label, url, anchor = match.groups()
@@ -334,14 +442,12 @@ def _rewrite_links_in_notebook(
 
         resolved = (notebook_file.parent / url).resolve()
         try:
-            if _rel_to_docs_root(resolved, docs_root) == _rel_to_docs_root(
-                old_abs, docs_root
-            ):
+            if resolved.relative_to(docs_root_resolved) == old_rel:
                 new_rel = os.path.relpath(new_abs, notebook_file.parent)
                 new_rel_posix = Path(new_rel).as_posix()
                 new_full_url = new_rel_posix + anchor
 
-                changes.append((full_url, new_full_url))
+                _append(_LinkChange(full_url, new_full_url))
 
                 if dry_run:
                     logger.info(
@@ -396,21 +502,35 @@ def _scan_and_rewrite(
         A list of `(old_url, new_url)` tuples representing every link change
         performed (or that *would* be performed in dry-run mode).
     """
+    # One scandir-backed walk instead of an rglob pass per extension; the
+    # suffix check happens inline so no per-entry stat or glob matching runs.
+    md_files: list[Path] = []
+    notebook_files: list[Path] = []
+    for dirpath, _dirnames, filenames in os.walk(docs_root):
+        base = Path(dirpath)
+        for name in filenames:
+            if name.endswith((".md", ".mdx")):
+                md_files.append(base / name)
+            elif name.endswith(".ipynb"):
+                notebook_files.append(base / name)
+
+    def _rewrite_md(md_file: Path) -> list[_LinkChange]:
+        return _rewrite_links(md_file, old_abs, new_abs, docs_root, dry_run=dry_run)
+
+    def _rewrite_notebook(notebook_file: Path) -> list[_LinkChange]:
+        return _rewrite_links_in_notebook(
+            notebook_file, old_abs, new_abs, docs_root, dry_run=dry_run
+        )
+
+    # Each file is an independent read-modify-write dominated by I/O, so the
+    # scan fans out over a thread pool; executor.map keeps results in
+    # submission order, preserving the serial change ordering.
     changes: list[_LinkChange] = []
-    for pattern in ["*.md", "*.mdx"]:
-        for md_file in docs_root.rglob(pattern):
-            file_changes = _rewrite_links(
-                md_file, old_abs, new_abs, docs_root, dry_run=dry_run
-            )
+    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        for file_changes in executor.map(_rewrite_md, md_files):
+            changes.extend(file_changes)
+        for file_changes in executor.map(_rewrite_notebook, notebook_files):
             changes.extend(file_changes)
-
-    # Process Jupyter notebooks
-    for notebook_file in docs_root.rglob("*.ipynb"):
-        changes.extend(
-            _rewrite_links_in_notebook(
-                notebook_file, old_abs, new_abs, docs_root, dry_run=dry_run
-            )
-        )
 
     return changes
 
@@ -454,6 +574,11 @@ def move_file_with_link_updates(
     old_abs: Path = old_path.expanduser().resolve()
     new_abs: Path = new_path.expanduser().resolve()
 
+    if old_abs == new_abs:
+        # Nothing moves, so no link anywhere can change - skip the tree scan.
+        logger.info("Source and destination are the same file - nothing to do.")
+        return []
+
     if git_root is None:
         git_root = _find_git_root(Path.cwd())
 
@@ -11,14 +11,16 @@ indentation and other nuances of Markdown syntax.
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 import typing
 from dataclasses import dataclass
 
 from pipeline.tools.lexer import Token, TokenType, lex
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable
 
 
 class ParseError(Exception):
@@ -69,7 +71,7 @@ class ParseError(Exception):
         return super().__str__()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Node:
     """Base-class for all AST nodes."""
 
@@ -77,14 +79,14 @@ class Node:
     limit_line: int  #: Line *after* the last source line (exclusive).
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Document(Node):
     """Root node that stores top-level blocks."""
 
     blocks: list[Node]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Heading(Node):
     """Markdown heading (#, ##, …)."""
 
@@ -92,14 +94,14 @@ class Heading(Node):
     value: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Paragraph(Node):
     """Consecutive text lines."""
 
     value: list[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CodeBlock(Node):
     """Fenced code block (```lang [meta])."""
 
@@ -108,35 +110,35 @@ class CodeBlock(Node):
     content: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ListItem(Node):
     """Single bullet/number item (may contain nested blocks)."""
 
     blocks: list[Node]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class UnorderedList(Node):
     """Bullet list (-, +, *)."""
 
     items: list[ListItem]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OrderedList(Node):
     """Numbered list (1., 2), …)."""
 
     items: list[ListItem]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class QuoteBlock(Node):
     """> Blockquote."""
 
     lines: list[str]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Tab(Node):
     """One tab inside a tab block (=== "Title")."""
 
@@ -144,14 +146,14 @@ class Tab(Node):
     blocks: list[Node]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TabBlock(Node):
     """Container for :class:`Tab` nodes."""
 
     tabs: list[Tab]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Admonition(Node):
     """!!! / ??? admonition."""
 
@@ -161,21 +163,21 @@ class Admonition(Node):
     blocks: list[Node]
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FrontMatter(Node):
     """YAML front-matter between --- delimiters."""
 
     content: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HTMLBlock(Node):
     """Raw HTML block (single line for now)."""
 
     content: str
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConditionalBlock(Node):
     """Custom conditional block (:::python or :::js)."""
 
@@ -193,8 +195,11 @@ class Parser:
         Args:
             source: Full Markdown text.
         """
-        self._tokens: Iterator[Token] = iter(lex(source))
-        self._token: Token = next(self._tokens)  # current look-ahead
+        # Tokenize eagerly; an index-based cursor over the materialized list
+        # is cheaper than generator resumption per consumed token.
+        self._tokens: list[Token] = list(lex(source))
+        self._pos: int = 0
+        self._token: Token = self._tokens[0]  # current look-ahead
 
     def parse(self) -> Document:
         """Parse *source* and return an AST root."""
@@ -213,9 +218,8 @@ class Parser:
     def _advance(self) -> Token:
         """Consume the current token and return it."""
         previous = self._token
-        try:
-            self._token = next(self._tokens)
-        except StopIteration:
+        pos = self._pos + 1
+        if pos >= len(self._tokens):
             # This should not happen if the lexer is working correctly
             # (it should always end with an EOF token), but handle it gracefully
             msg = "Unexpected end of input"
@@ -225,7 +229,9 @@ class Parser:
                 token=previous,
                 expected="more tokens",
                 found="end of input",
-            ) from None
+            )
+        self._pos = pos
+        self._token = self._tokens[pos]
         return previous
 
     def _check(self, *kinds: TokenType) -> bool:
@@ -243,30 +249,12 @@ class Parser:
     # Block dispatch
     # ------------------------------------------------------------------
 
-    # Ignoring PLR0911 (too many return statements) here as this is a
-    # dispatch method that routes to specific block parsers based on the
-    # current token type.
-    def _parse_block(self) -> Node:  # noqa: PLR0911
+    def _parse_block(self) -> Node:
         """Route to the correct *block* parser based on current token."""
-        if self._check(TokenType.HEADING):
-            return self._parse_heading()
-        if self._check(TokenType.FENCE):
-            return self._parse_code_block()
-        if self._check(TokenType.UL_MARKER):
-            return self._parse_list(ordered=False)
-        if self._check(TokenType.OL_MARKER):
-            return self._parse_list(ordered=True)
-        if self._check(TokenType.BLOCKQUOTE):
-            return self._parse_quote_block()
-        if self._check(TokenType.ADMONITION):
-            return self._parse_admonition()
-        if self._check(TokenType.TAB_HEADER):
-            return self._parse_tab_block()
-        if self._check(TokenType.HTML_TAG):
-            return self._parse_html_block()
-        if self._check(TokenType.CONDITIONAL_BLOCK_OPEN):
-            return self._parse_conditional_block()
-        return self._parse_paragraph()
+        handler = self._BLOCK_DISPATCH.get(self._token.type)
+        if handler is None:
+            return self._parse_paragraph()
+        return handler(self)
 
     # ------------------------------------------------------------------
     # Concrete block parsers
@@ -275,20 +263,29 @@ class Parser:
     def _parse_blocks_until_indent(self, min_indent: int) -> list[Node]:
         """Parse blocks into a sequence until we hit a shallower indent."""
         blocks: list[Node] = []
-        while not self._check(TokenType.EOF) and (
-            self._token.indent > min_indent or self._token.type == TokenType.BLANK
-        ):
+        while True:
+            # Read the look-ahead token once per iteration; the loop condition
+            # and the error paths below all inspect the same token.
+            token = self._token
+            token_type = token.type
+            if token_type is TokenType.EOF or (
+                token.indent <= min_indent and token_type is not TokenType.BLANK
+            ):
+                break
             # Check for unexpected structural tokens that shouldn't appear in
             # this context
-            if self._check(TokenType.CONDITIONAL_BLOCK_CLOSE, TokenType.FRONT_MATTER):
+            if token_type in (
+                TokenType.CONDITIONAL_BLOCK_CLOSE,
+                TokenType.FRONT_MATTER,
+            ):
                 token_descriptions = {
                     TokenType.CONDITIONAL_BLOCK_CLOSE: "conditional block close ':::'",
                     TokenType.FRONT_MATTER: "front matter delimiter '---'",
                 }
-                found_desc = token_descriptions[self._token.type]
+                found_desc = token_descriptions[token_type]
 
                 # Special message for conditional block close with indentation info
-                if self._token.type == TokenType.CONDITIONAL_BLOCK_CLOSE:
+                if token_type is TokenType.CONDITIONAL_BLOCK_CLOSE:
                     msg = (
                         "Conditional block close ':::' has mismatched indentation - "
                         "check that opening and closing tags have the same "
@@ -296,19 +293,19 @@ class Parser:
                     )
                     raise ParseError(
                         msg,
-                        line=self._token.line,
-                        token=self._token,
+                        line=token.line,
+                        token=token,
                         expected=f"content with indent > {min_indent} or properly "
                         f"indented closing tag",
                         found=f"conditional block close ':::' at indent "
-                        f"{self._token.indent} (should match opening tag indent)",
+                        f"{token.indent} (should match opening tag indent)",
                     )
-                token_type_desc = self._token.type.name.lower().replace("_", " ")
+                token_type_desc = token_type.name.lower().replace("_", " ")
                 msg = f"Unexpected {token_type_desc} token"
                 raise ParseError(
                     msg,
-                    line=self._token.line,
-                    token=self._token,
+                    line=token.line,
+                    token=token,
                     expected="content or block end",
                     found=found_desc,
                 )
@@ -321,7 +318,7 @@ class Parser:
         """Parse YAML front-matter (--- … ---)."""
         open_token = self._advance()  # opening '---'
         content_lines: list[str] = []
-        while not self._check(TokenType.FRONT_MATTER):
+        while self._token.type is not TokenType.FRONT_MATTER:
             content_lines.append(self._advance().value)
         close_token = self._advance()  # closing '---'
         return FrontMatter(
@@ -360,8 +357,8 @@ class Parser:
         # preserve in the output.
         fence_indent = open_token.indent
         body_lines: list[str] = []
-        while not self._check(TokenType.FENCE):
-            if self._check(TokenType.EOF):
+        while self._token.type is not TokenType.FENCE:
+            if self._token.type is TokenType.EOF:
                 msg = "Unclosed code block"
                 raise ParseError(
                     msg,
@@ -405,12 +402,20 @@ class Parser:
             items=items, start_line=items[0].start_line, limit_line=items[-1].limit_line
         )
 
+    def _parse_unordered_list(self) -> Node:
+        """Parse an unordered list (dispatch helper)."""
+        return self._parse_list(ordered=False)
+
+    def _parse_ordered_list(self) -> Node:
+        """Parse an ordered list (dispatch helper)."""
+        return self._parse_list(ordered=True)
+
     def _parse_list_item(self, list_indent: int) -> ListItem:
         """Parse a single list item and its nested content."""
         marker_tok = self._advance()
-        first_text = (
-            marker_tok.value.split(maxsplit=1)[1] if " " in marker_tok.value else ""
-        )
+        # Split once: parts[1] is the text after the marker, if any.
+        parts = marker_tok.value.split(maxsplit=1)
+        first_text = parts[1] if len(parts) > 1 else ""
 
         nested_blocks = self._parse_blocks_until_indent(list_indent)
 
@@ -434,7 +439,7 @@ class Parser:
         """Parse a > blockquote."""
         first_token = self._advance()
         lines = [first_token.value.lstrip("> ")]
-        while self._check(TokenType.BLOCKQUOTE):
+        while self._token.type is TokenType.BLOCKQUOTE:
             lines.append(self._advance().value.lstrip("> "))
         return QuoteBlock(
             lines=lines, start_line=first_token.line, limit_line=self._token.line
@@ -444,7 +449,11 @@ class Parser:
         """Parse !!! / ??? admonitions."""
         header_tok = self._advance()
         tag, *tail = header_tok.value.split(None, 2)
-        kind = tail[0].lower() if tail else "note"
+        # tag is always "!!!" or "???" and kind one of a handful of keywords;
+        # interning dedupes the split results and makes later comparisons
+        # pointer-fast.
+        tag = sys.intern(tag)
+        kind = sys.intern(tail[0].lower()) if tail else "note"
         expected_tail_length = 2
         title = tail[1] if len(tail) == expected_tail_length else ""
         # Remove whitespace (especially trailing whitespace)
@@ -464,7 +473,10 @@ class Parser:
         tabs: list[Tab] = []
         while self._check(TokenType.TAB_HEADER):
             header_tok = self._advance()
-            title = header_tok.value.split('"', 1)[1].rsplit('"', 1)[0]
+            # The lexer guarantees a quoted title, so slice it out directly
+            # instead of allocating intermediate lists via split/rsplit.
+            value = header_tok.value
+            title = value[value.index('"') + 1 : value.rindex('"')]
 
             inner_blocks = self._parse_blocks_until_indent(header_tok.indent)
 
@@ -486,7 +498,7 @@ class Parser:
         first_tok = self._advance()
 
         lines = [" " * first_tok.indent + first_tok.value]
-        while self._check(TokenType.HTML_TAG):
+        while self._token.type is TokenType.HTML_TAG:
             tok = self._advance()
             lines.append(" " * tok.indent + tok.value)
 
@@ -545,7 +557,7 @@ class Parser:
         """Collect consecutive TEXT tokens into a paragraph."""
         first = self._token
         text_lines: list[str] = []
-        while self._check(TokenType.TEXT):
+        while self._token.type is TokenType.TEXT:
             text_lines.append(self._advance().value)
         while self._match(TokenType.BLANK):
             pass  # swallow blank lines following the paragraph
@@ -553,6 +565,22 @@ class Parser:
             value=text_lines, start_line=first.line, limit_line=self._token.line
         )
 
+    # Token type -> block parser method, built after the methods so the names
+    # are in scope; `_parse_block` routes with a single dict lookup instead of
+    # probing token types one by one. TEXT (and anything else not listed)
+    # falls through to `_parse_paragraph`.
+    _BLOCK_DISPATCH: typing.ClassVar[dict[TokenType, Callable[[Parser], Node]]] = {
+        TokenType.HEADING: _parse_heading,
+        TokenType.FENCE: _parse_code_block,
+        TokenType.UL_MARKER: _parse_unordered_list,
+        TokenType.OL_MARKER: _parse_ordered_list,
+        TokenType.BLOCKQUOTE: _parse_quote_block,
+        TokenType.ADMONITION: _parse_admonition,
+        TokenType.TAB_HEADER: _parse_tab_block,
+        TokenType.HTML_TAG: _parse_html_block,
+        TokenType.CONDITIONAL_BLOCK_OPEN: _parse_conditional_block,
+    }
+
 
 # ---------------------------------------------------------------------------
 # MintPrinter - AST to Mintlify markdown converter
@@ -578,16 +606,22 @@ class MintPrinter:
         self._visit(node)
         return "\n".join(self.output).rstrip() + "\n"
 
+    # Precomputed indent prefixes for the nesting depths seen in practice;
+    # deeper levels fall back to building the string on demand.
+    _INDENTS: typing.ClassVar[tuple[str, ...]] = tuple(
+        "  " * level for level in range(16)
+    )
+
     def _add_line(self, line: str) -> None:
         """Add a line with proper indentation."""
-        indent = "  " * self.indent_level
-        self.output.append(f"{indent}{line}")
+        level = self.indent_level
+        indent = self._INDENTS[level] if level < len(self._INDENTS) else "  " * level
+        self.output.append(indent + line)
 
     def _visit(self, node: Node) -> None:
         """Visit a node and dispatch to the appropriate handler."""
-        method_name = f"_visit_{type(node).__name__.lower()}"
-        method = getattr(self, method_name, self._visit_generic)
-        method(node)
+        handler = self._DISPATCH.get(type(node), MintPrinter._visit_generic)
+        handler(self, node)
 
     def _visit_generic(self, node: Node) -> None:
         """Generic visitor for unhandled nodes."""
@@ -646,8 +680,10 @@ class MintPrinter:
 
     def _visit_paragraph(self, node: Paragraph) -> None:
         """Visit a paragraph node."""
-        for _i, line in enumerate(node.value):
-            self._add_line(line.strip())
+        # Hoist the indent prefix; paragraphs dominate typical documents and
+        # going through _add_line would recompute it for every line.
+        indent = "  " * self.indent_level
+        self.output.extend(indent + line.strip() for line in node.value)
 
     def _visit_codeblock(self, node: CodeBlock) -> None:
         """Visit a code block node and format for Mintlify."""
@@ -655,9 +691,10 @@ class MintPrinter:
 
         # Build the opening fence with language and metadata
         if node.language:
-            fence_line = f"{fence}{node.language}"
             if node.meta:
                 fence_line = f"{fence}{node.language} {node.meta}"
+            else:
+                fence_line = f"{fence}{node.language}"
         else:
             fence_line = fence
 
@@ -665,8 +702,13 @@ class MintPrinter:
 
         # Add the code content
         if node.content:
-            for line in node.content.split("\n"):
-                self._add_line(line)
+            if self.indent_level == 0:
+                # Top-level block: the content is already newline-joined, so it
+                # can be emitted as one chunk instead of re-split per line.
+                self.output.append(node.content)
+            else:
+                for line in node.content.split("\n"):
+                    self._add_line(line)
 
         self._add_line(fence)
 
@@ -806,16 +848,50 @@ class MintPrinter:
         # Add the closing tag
         self._add_line(":::")
 
+    # Node type -> handler method, built after the methods so the names are
+    # in scope; `_visit` dispatches with a single dict lookup instead of
+    # building an f-string method name + getattr per node. Each handler takes
+    # its concrete node subtype, hence the `Any` in the value type.
+    _DISPATCH: typing.ClassVar[
+        dict[type[Node], Callable[[MintPrinter, typing.Any], None]]
+    ] = {
+        Document: _visit_document,
+        Heading: _visit_heading,
+        Paragraph: _visit_paragraph,
+        CodeBlock: _visit_codeblock,
+        UnorderedList: _visit_unorderedlist,
+        OrderedList: _visit_orderedlist,
+        ListItem: _visit_listitem,
+        QuoteBlock: _visit_quoteblock,
+        TabBlock: _visit_tabblock,
+        Tab: _visit_tab,
+        Admonition: _visit_admonition,
+        FrontMatter: _visit_frontmatter,
+        HTMLBlock: _visit_htmlblock,
+        ConditionalBlock: _visit_conditionalblock,
+    }
+
+
+@functools.lru_cache(maxsize=256)
+def _to_mint_cached(markdown: str) -> str:
+    """Parse and print *markdown*, memoizing results for repeated inputs.
+
+    Batch conversions (snippets, shared includes) frequently feed identical
+    sources through ``to_mint``; caching on the input text skips the whole
+    lex/parse/print pipeline for repeats. Failed parses are not cached.
+    """
+    parser = Parser(markdown)
+    doc = parser.parse()
+    printer = MintPrinter()
+    return printer.print(doc)
+
 
 def to_mint(markdown: str, file_path: str | None = None) -> str:
     """Convenience function to print an AST node as Mintlify markdown."""
     if not markdown:
         return ""
     try:
-        parser = Parser(markdown)
-        doc = parser.parse()
-        printer = MintPrinter()
-        return printer.print(doc)
+        return _to_mint_cached(markdown)
     except ParseError as e:
         # Re-raise with file path context if not already present
         if e.file_path is None and file_path is not None:
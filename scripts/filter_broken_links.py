@@ -14,49 +14,64 @@ Usage:
 
 import argparse
 import re
+import string
 import sys
 
+# Compiled once at import; applied only to lines that pass the cheap
+# startswith prefilter below.
+INTEGRATIONS_RE = re.compile(r"^oss/(python|javascript)/integrations/")
+SUMMARY_RE = re.compile(r"\d+ broken links found\.")
+
+ASCII_LETTERS = frozenset(string.ascii_letters)
+INDENT_CHARS = (" ", "\t")
+
 
 def filter_broken_links(input_stream, exclude_integrations=False):
     """Filter broken links output, optionally excluding integration directories."""
     skip = False
     link_count = 0
+    output = []
 
     for line in input_stream:
         line = line.rstrip()
 
         if exclude_integrations:
             # Check if this is an integration file header
-            if re.match(r"^oss/(python|javascript)/integrations/", line):
+            if line.startswith("oss/") and INTEGRATIONS_RE.match(line):
                 skip = True
                 continue
 
-            # Check if this is a new file header (reset skip)
-            if re.match(r"^[a-zA-Z]", line) and not re.match(r"^[ \t]", line):
+            # Check if this is a new file header (reset skip).
+            # An ASCII-letter first character also rules out indentation,
+            # so no separate leading-whitespace test is needed.
+            if line[:1] in ASCII_LETTERS:
                 skip = False
 
         # If we're not skipping, process the line
         if not skip:
             # Count broken links (indented lines starting with /)
-            if re.match(r"^[ \t]+/", line):
+            if line.startswith(INDENT_CHARS) and line.lstrip(" \t").startswith("/"):
                 link_count += 1
 
             # Update the summary line with correct count
             if "broken links found." in line:
-                if exclude_integrations:
-                    line = re.sub(
-                        r"\d+ broken links found\.",
-                        f"{link_count} broken links found (excluding integrations).",
-                        line,
-                    )
-                else:
-                    line = re.sub(
-                        r"\d+ broken links found\.",
-                        f"{link_count} broken links found.",
-                        line,
-                    )
-
-            print(line)
+                match = SUMMARY_RE.search(line)
+                if match:
+                    if exclude_integrations:
+                        summary = (
+                            f"{link_count} broken links found (excluding integrations)."
+                        )
+                    else:
+                        summary = f"{link_count} broken links found."
+                    line = line[: match.start()] + summary + line[match.end() :]
+
+            output.append(line)
+
+    # Emit everything with one buffered write instead of a print per line
+    if output:
+        output.append("")  # trailing newline
+        sys.stdout.write("\n".join(output))
+        sys.stdout.flush()
 
 
 def main():
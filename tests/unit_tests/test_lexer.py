@@ -55,6 +55,16 @@ def test_ordered_list_marker() -> None:
     assert tokens[1].type == TokenType.EOF
 
 
+def test_non_decimal_digits_are_text() -> None:
+    """Test that non-decimal digit characters do not start an ordered list."""
+    # Circled numbers satisfy str.isdigit but not \d; they must stay TEXT.
+    tokens = list(lex("②) x"))
+    assert len(tokens) == 2
+    assert tokens[0].type == TokenType.TEXT
+    assert tokens[0].value == "②) x"
+    assert tokens[1].type == TokenType.EOF
+
+
 def test_blockquote() -> None:
     """Test lexing a blockquote."""
     tokens = list(lex("> Quote"))
@@ -6,124 +6,82 @@ temporary and backup files that should be ignored by the watcher.
 """
 
 import asyncio
-from pathlib import Path
+from collections.abc import Iterator
+from pathlib import PurePosixPath
+
+import pytest
 
 from pipeline.core.builder import DocumentationBuilder
 from pipeline.core.watcher import DocsFileHandler
 from tests.unit_tests.utils import file_system
 
 
-def test_should_ignore_backup_files() -> None:
-    """Test that backup files with ~ suffix are properly ignored.
+@pytest.fixture(scope="module")
+def handler() -> Iterator[DocsFileHandler]:
+    """Provide a DocsFileHandler backed by one shared builder.
 
-    This test verifies that the watcher correctly identifies and ignores
-    backup files created by editors, which was the source of the original
-    threading error when backup files were processed.
+    The filtering tests only inspect file names, so a single builder,
+    queue and event loop can be shared by the whole module instead of
+    constructing them per test.
     """
     with file_system([]) as fs:
         builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
         event_queue = asyncio.Queue()  # type: ignore[var-annotated]
         loop = asyncio.new_event_loop()
-
-        handler = DocsFileHandler(builder, event_queue, loop)
-
-        # Test backup files (should be ignored)
-        backup_files = [
-            Path("langchain-models.mdx~"),
-            Path("src/oss/langchain/models.mdx~"),
-            Path("documentation.md~"),
-            Path("config.json~"),
-        ]
-
-        for file_path in backup_files:
-            assert handler._should_ignore_file(file_path), (
-                f"Should ignore backup file: {file_path}"
-            )
-
-
-def test_should_ignore_temporary_files() -> None:
-    """Test that various temporary files are properly ignored."""
-    with file_system([]) as fs:
-        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
-        event_queue = asyncio.Queue()  # type: ignore[var-annotated]
-        loop = asyncio.new_event_loop()
-
-        handler = DocsFileHandler(builder, event_queue, loop)
-
-        # Test temporary files (should be ignored)
-        temp_files = [
-            Path("file.bak"),
-            Path("file.orig"),
-            Path(".file.tmp"),
-            Path(".file.swp"),
-            Path("document.bak"),
-            Path("backup.orig"),
-        ]
-
-        for file_path in temp_files:
-            assert handler._should_ignore_file(file_path), (
-                f"Should ignore temporary file: {file_path}"
-            )
-
-
-def test_should_not_ignore_valid_files() -> None:
-    """Test that valid documentation files are NOT ignored."""
-    with file_system([]) as fs:
-        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
-        event_queue = asyncio.Queue()  # type: ignore[var-annotated]
-        loop = asyncio.new_event_loop()
-
-        handler = DocsFileHandler(builder, event_queue, loop)
-
-        # Test valid files (should NOT be ignored)
-        valid_files = [
-            Path("langchain-models.mdx"),
-            Path("documentation.md"),
-            Path("config.json"),
-            Path("image.png"),
-            Path("script.js"),
-            Path("styles.css"),
-            Path("data.yml"),
-            Path("info.yaml"),
-            Path("icon.svg"),
-            Path("photo.jpg"),
-            Path("picture.jpeg"),
-            Path("animation.gif"),
-        ]
-
-        for file_path in valid_files:
-            assert not handler._should_ignore_file(file_path), (
-                f"Should NOT ignore valid file: {file_path}"
-            )
-
-
-def test_edge_cases() -> None:
-    """Test edge cases for file filtering."""
-    with file_system([]) as fs:
-        builder = DocumentationBuilder(fs.src_dir, fs.build_dir)
-        event_queue = asyncio.Queue()  # type: ignore[var-annotated]
-        loop = asyncio.new_event_loop()
-
-        handler = DocsFileHandler(builder, event_queue, loop)
-
-        # Test edge cases
-        edge_cases = [
-            # Files with tilde in the middle (should NOT be ignored)
-            (Path("file~name.mdx"), False),
-            (Path("test~123.md"), False),
-            # Files ending with tilde (should be ignored)
-            (Path("file~"), True),
-            (Path("name.ext~"), True),
-            # Hidden files that are not temp files (should NOT be ignored)
-            (Path(".gitignore"), False),
-            (Path(".config.json"), False),
-            # Files with multiple extensions
-            (Path("file.backup.bak"), True),
-            (Path("file.old.orig"), True),
-        ]
-
-        for file_path, should_ignore in edge_cases:
-            result = handler._should_ignore_file(file_path)
-            assert result == should_ignore, (
-                f"File {file_path}: expected ignore={should_ignore}, got {result}"
-            )
+        try:
+            yield DocsFileHandler(builder, event_queue, loop)
+        finally:
+            loop.close()
+
+
+@pytest.mark.parametrize(
+    ("file_path", "should_ignore"),
+    [
+        # Backup files with ~ suffix (the source of the original
+        # threading error when backup files were processed)
+        (PurePosixPath("langchain-models.mdx~"), True),
+        (PurePosixPath("src/oss/langchain/models.mdx~"), True),
+        (PurePosixPath("documentation.md~"), True),
+        (PurePosixPath("config.json~"), True),
+        # Various temporary files
+        (PurePosixPath("file.bak"), True),
+        (PurePosixPath("file.orig"), True),
+        (PurePosixPath(".file.tmp"), True),
+        (PurePosixPath(".file.swp"), True),
+        (PurePosixPath("document.bak"), True),
+        (PurePosixPath("backup.orig"), True),
+        # Valid documentation files must NOT be ignored
+        (PurePosixPath("langchain-models.mdx"), False),
+        (PurePosixPath("documentation.md"), False),
+        (PurePosixPath("config.json"), False),
+        (PurePosixPath("image.png"), False),
+        (PurePosixPath("script.js"), False),
+        (PurePosixPath("styles.css"), False),
+        (PurePosixPath("data.yml"), False),
+        (PurePosixPath("info.yaml"), False),
+        (PurePosixPath("icon.svg"), False),
+        (PurePosixPath("photo.jpg"), False),
+        (PurePosixPath("picture.jpeg"), False),
+        (PurePosixPath("animation.gif"), False),
+        # Files with tilde in the middle (should NOT be ignored)
+        (PurePosixPath("file~name.mdx"), False),
+        (PurePosixPath("test~123.md"), False),
+        # Files ending with tilde (should be ignored)
+        (PurePosixPath("file~"), True),
+        (PurePosixPath("name.ext~"), True),
+        # Hidden files that are not temp files (should NOT be ignored)
+        (PurePosixPath(".gitignore"), False),
+        (PurePosixPath(".config.json"), False),
+        # Files with multiple extensions
+        (PurePosixPath("file.backup.bak"), True),
+        (PurePosixPath("file.old.orig"), True),
+    ],
+)
+def test_should_ignore_file(
+    handler: DocsFileHandler, file_path: PurePosixPath, should_ignore: bool
+) -> None:
+    """Test backup/temporary file filtering against the full case table."""
+    result = handler._should_ignore_file(file_path)
+    assert result == should_ignore, (
+        f"File {file_path}: expected ignore={should_ignore}, got {result}"
+    )
@@ -4,6 +4,8 @@ This module provides test utilities including context managers for setting up
 temporary file systems with source and build directories.
 """
 
+import atexit
+import os
 import shutil
 import tempfile
 from collections.abc import Iterator
@@ -12,6 +14,22 @@ from pathlib import Path
 
 from typing_extensions import NotRequired, TypedDict
 
+_tmp_root: Path | None = None
+
+
+def _test_tmp_root() -> Path:
+    """Return a per-process parent directory for test temp dirs.
+
+    Creating every test's temp dir under one shared root keeps repeated
+    mkdtemp calls cheap (one system temp lookup per process) and lets a
+    single atexit hook sweep up anything a crashed test left behind.
+    """
+    global _tmp_root  # noqa: PLW0603
+    if _tmp_root is None:
+        _tmp_root = Path(tempfile.mkdtemp(prefix="docs-tests-"))
+        atexit.register(shutil.rmtree, _tmp_root, ignore_errors=True)
+    return _tmp_root
+
 
 class File(TypedDict):
     """Represents a file in the test file system."""
@@ -58,10 +76,12 @@ class FileSystem:
         if not self.build_dir.exists():
             return []
 
+        # os.walk is scandir-based, so file/dir classification comes from the
+        # directory entries themselves instead of a stat call per path.
         files = [
-            file_path.relative_to(self.build_dir)
-            for file_path in self.build_dir.rglob("*")
-            if file_path.is_file()
+            Path(dirpath).relative_to(self.build_dir) / name
+            for dirpath, _dirnames, filenames in os.walk(self.build_dir)
+            for name in filenames
         ]
         return sorted(files)
 
@@ -101,7 +121,7 @@ def file_system(files: list[File]) -> Iterator[FileSystem]:
             assert fs.build_file_exists("index.md")
         ```
     """
-    temp_dir = Path(tempfile.mkdtemp())
+    temp_dir = Path(tempfile.mkdtemp(dir=_test_tmp_root()))
     src_dir = temp_dir / "src"
     build_dir = temp_dir / "build"
 
@@ -110,13 +130,14 @@ def file_system(files: list[File]) -> Iterator[FileSystem]:
         src_dir.mkdir()
         build_dir.mkdir()
 
+        # Create each distinct parent directory once up front
+        for parent in {(src_dir / file["path"]).parent for file in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
         # Create test files in src directory
         for file in files:
             file_path = src_dir / file["path"]
 
-            # Create parent directories if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Write file content
             if file.get("bytes") is not None:
                 file_path.write_bytes(file["bytes"])
@@ -157,16 +178,17 @@ def temp_directory(files: list[File]) -> Iterator[Path]:
             assert (temp_dir / "index.md").exists()
         ```
     """
-    temp_dir = Path(tempfile.mkdtemp()).resolve()
+    temp_dir = Path(tempfile.mkdtemp(dir=_test_tmp_root())).resolve()
 
     try:
+        # Create each distinct parent directory once up front
+        for parent in {(temp_dir / file["path"]).parent for file in files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
         # Create test files in temp directory
         for file in files:
             file_path = temp_dir / file["path"]
 
-            # Create parent directories if needed
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Write file content
             if file.get("bytes") is not None:
                 file_path.write_bytes(file["bytes"])
@@ -1,27 +1,36 @@
-import glob
+import os
 
 
-def update_mdx_files():
-    # Get all MDX files in the specified directories
-    mdx_files = []
+def iter_mdx_files():
+    # Walk each content root once with os.walk (scandir-based) and yield
+    # MDX files lazily instead of materializing recursive glob lists
     for root in ["oss", "langsmith", "langgraph-platform"]:
-        mdx_files.extend(glob.glob(f"{root}/**/*.mdx", recursive=True))
+        for dirpath, dirnames, filenames in os.walk(root):
+            # glob skipped dot-directories; prune them so hidden trees
+            # (e.g. editor backups) are never rewritten
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.endswith(".mdx"):
+                    yield os.path.join(dirpath, name)
+
 
-    for file_path in mdx_files:
+def update_mdx_files():
+    for file_path in iter_mdx_files():
         try:
-            with open(file_path) as f:
-                content = f.read()
+            with open(file_path, "rb") as f:
+                raw = f.read()
 
-            # Only add if the placeholder heading is not already present
-            if "## Placeholder heading" not in content:
+            # Only add if the placeholder heading is not already present;
+            # probing the raw bytes skips the UTF-8 decode for files that
+            # were already updated on a previous run
+            if b"## Placeholder heading" not in raw:
+                content = raw.decode()
                 # Add the placeholder heading and text after the first heading
-                if "# " in content:
-                    parts = content.split("# ", 1)
+                before, sep, after = content.partition("# ")
+                if sep:
                     new_content = (
-                        parts[0]
-                        + "# "
-                        + parts[1]
-                        + "\n\n## Placeholder heading\n\nThis is an example"
+                        f"{before}{sep}{after}"
+                        "\n\n## Placeholder heading\n\nThis is an example"
                     )
 
                     with open(file_path, "w") as f: